@@ -1,12 +1,12 @@
 """
 ================================================================================
-TTS_CLIPBOARD_MP3 v0.6.7
+TTS_CLIPBOARD_MP3 v0.6.8
 ================================================================================
 Arquivo:        main.py
 Projeto:        Texto colado → (1) Ler em voz alta (sem MP3) OU (2) Gerar MP3 (pt)
 Autor:          Fábio Bettio
 Licença:        Uso educacional / experimental
-Data:           06/01/2026
+Data:           15/10/2026
 Chat (contexto desta versão):
     https://chatgpt.com/share/695d76d5-1714-8005-a00c-5ecf39ffea93
 
@@ -20,12 +20,33 @@ NOTAS
 
 REQUISITOS
     pip install pyttsx3 gtts edge-tts
+    (Opcional) pip install orjson  (config JSON mais rápida)
     (Recomendado) FFmpeg no PATH:
         winget install Gyan.FFmpeg
 
 ================================================================================
 CHANGELOG
-    v0.6.7 (06/01/2026) (~LINHAS A CONFIRMAR)
+    v0.6.8 (15/10/2026) (~LINHAS A CONFIRMAR)
+        - Edge TTS: blocos sintetizados em paralelo (asyncio.gather + semáforo);
+          gTTS em pool de threads. Quantidade configurável em Configurações → Performance.
+        - FFmpeg testado uma vez por PATH, em segundo plano; SALVAR CONFIG e
+          REINICIAR MOTOR refazem o teste.
+        - Amostra da voz ao escolher no combo (gerada uma vez, guardada em .cache).
+        - Edge TTS: um único event loop asyncio em thread própria, reusado entre jobs.
+        - LER AGORA: motor pyttsx3 dirigido por iterate(); PARAR responde no meio do bloco.
+        - Aba LOG atualizada em lote pela thread do Tk (fila drenada a cada 120 ms).
+        - Log em arquivo gravado por thread própria (handle persistente, flush em lote).
+        - Modo de concatenação do gTTS configurável (auto/raw/ffmpeg).
+        - Concatenação direta remove a tag ID3v2 das partes após a primeira.
+        - Resumo do texto: recálculo adiado (150 ms) durante a digitação e
+          contagem de blocos calculada fora da thread da interface; LER AGORA e
+          GERAR MP3 reaproveitam o último split.
+        - Edge TTS: áudio gravado direto no MP3 final (sem partes nem concat).
+        - gTTS: partes com o mesmo formato MPEG são concatenadas sem FFmpeg,
+          na ordem, enquanto os blocos seguintes ainda são sintetizados.
+        - Cache em disco (<saída>/.cache) dos blocos já sintetizados (LRU por tamanho).
+        - Abas LOG e SOBRE montadas só na primeira vez que são abertas.
+    v0.6.7 (06/01/2026) (~1250 linhas)
         - Configuração persistente do diretório de saída (pergunta se vazio).
         - Diretório só muda na guia Configurações (botão Procurar + Salvar).
         - Guia LOG: inicialização, fechamento, travamento, leituras, conversões, erros,
@@ -67,15 +88,22 @@ CHANGELOG
         - Primeira versão utilizável (Ctrl+V → gerar MP3).
 ================================================================================
 REGRA DE LINHAS
-    - O número de linhas de v0.6.7 será corrigido na próxima interação.
+    - O número de linhas de v0.6.8 será corrigido na próxima interação.
 ================================================================================
 """
 
 from __future__ import annotations
 
 import asyncio
+import atexit
+import concurrent.futures
+import functools
+import hashlib
+import inspect
+import itertools
 import json
 import os
+import queue
 import re
 import shutil
 import subprocess
@@ -83,10 +111,11 @@ import sys
 import tempfile
 import threading
 import time
-from dataclasses import dataclass, asdict
+from collections import OrderedDict, deque
+from dataclasses import dataclass, replace
 from datetime import datetime
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import List, Set, Tuple, Optional
 
 import tkinter as tk
 from tkinter import messagebox, filedialog
@@ -104,9 +133,26 @@ try:
 except Exception:
     edge_tts = None
 
-APP_VERSION = "0.6.7"
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+try:
+    import winsound
+except Exception:
+    winsound = None
+
+APP_VERSION = "0.6.8"
 CONFIG_PATH = Path.cwd() / "config_tts_clipboard_mp3.json"
 DEFAULT_OUT_DIR = (Path.cwd() / "saida_mp3")
+EDGE_CONCURRENCY = 4  # requisições simultâneas ao Edge TTS (evita throttling)
+FFMPEG_CONCAT_GROUP = 32  # partes por processo FFmpeg (acima disso, concat em grupos)
+SPLIT_CACHE_SIZE = 8  # splits lembrados (texto × tamanho de bloco)
+PREVIEW_TEXT = "Olá! Esta é uma amostra desta voz."
+# Partes temporárias em RAM (tmpfs) quando existir e couber: não passam pelo disco antes do concat.
+SHM_DIR = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+GTTS_BYTES_PER_CHAR = 600  # estimativa folgada do MP3 do gTTS (32 kbps, inclui modo lento)
 
 
 # =========================
@@ -115,42 +161,103 @@ DEFAULT_OUT_DIR = (Path.cwd() / "saida_mp3")
 class AppLogger:
     def __init__(self):
         self._lock = threading.Lock()
-        self._lines: List[str] = []
         self._max_lines = 5000
+        self._lines: "deque[str]" = deque(maxlen=self._max_lines)  # descarta as antigas em O(1)
         self._log_file: Optional[Path] = None
         self._on_newline_cb = None  # type: ignore
+        self._ts_cache: Tuple[int, str] = (0, "")
+        # Disco fica com uma thread própria: quem loga (UI/workers) só enfileira.
+        # Itens: linha (str), Path (troca de arquivo), Event (flush) ou None (fim).
+        self._q: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._writer = threading.Thread(target=self._writer_loop, name="log-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
 
     def set_log_file(self, path: Path):
         self._log_file = path
+        self._q.put(Path(path))
+
+    def _writer_loop(self):
+        path: Optional[Path] = None
+        fh = None
+        while True:
+            item = self._q.get()
+            batch = [item]
+            # junta o que já estiver na fila: um flush por lote
+            while len(batch) < 256:
+                try:
+                    batch.append(self._q.get_nowait())
+                except queue.Empty:
+                    break
+            for item in batch:
+                if isinstance(item, str):
+                    if path is None:
+                        continue
+                    try:
+                        if fh is None:
+                            path.parent.mkdir(parents=True, exist_ok=True)
+                            fh = open(path, "a", encoding="utf-8", buffering=8192)
+                        fh.write(item + "\n")
+                    except Exception:
+                        fh = None
+                elif isinstance(item, Path):
+                    if item != path and fh is not None:
+                        fh.close()
+                        fh = None
+                    path = item
+                elif isinstance(item, threading.Event):
+                    if fh is not None:
+                        fh.flush()
+                    item.set()
+                else:  # None: encerrar
+                    if fh is not None:
+                        fh.close()
+                    return
+            if fh is not None:
+                try:
+                    fh.flush()
+                except Exception:
+                    fh = None
 
-    def set_ui_callback(self, cb):
-        self._on_newline_cb = cb
+    def flush(self, timeout: float = 1.0):
+        done = threading.Event()
+        self._q.put(done)
+        done.wait(timeout)
+
+    def close(self):
+        if self._writer.is_alive():
+            self._q.put(None)
+            self._writer.join(timeout=2.0)
+
+    def attach_ui(self, cb) -> str:
+        # Liga o callback e devolve o histórico atomicamente: nenhuma linha
+        # aparece duas vezes nem se perde entre o dump e o callback.
+        with self._lock:
+            self._on_newline_cb = cb
+            return "\n".join(self._lines)
 
     def _ts(self) -> str:
-        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        # strftime só quando muda o segundo (rajadas de log caem no mesmo segundo)
+        sec = int(time.time())
+        cached = self._ts_cache
+        if cached[0] == sec:
+            return cached[1]
+        ts = datetime.fromtimestamp(sec).strftime("%Y-%m-%d %H:%M:%S")
+        self._ts_cache = (sec, ts)
+        return ts
 
     def log(self, level: str, msg: str):
         line = f"[{self._ts()}] [{level.upper():7}] {msg}"
         with self._lock:
             self._lines.append(line)
-            if len(self._lines) > self._max_lines:
-                self._lines = self._lines[-self._max_lines :]
+            self._q.put(line)  # dentro do lock: arquivo na mesma ordem da memória
 
-        # arquivo
-        if self._log_file is not None:
-            try:
-                self._log_file.parent.mkdir(parents=True, exist_ok=True)
-                with open(self._log_file, "a", encoding="utf-8") as f:
-                    f.write(line + "\n")
-            except Exception:
-                pass
-
-        # UI
-        if self._on_newline_cb:
-            try:
-                self._on_newline_cb(line)
-            except Exception:
-                pass
+            # UI (o callback só enfileira; a thread do Tk drena em lote)
+            if self._on_newline_cb:
+                try:
+                    self._on_newline_cb(line)
+                except Exception:
+                    pass
 
     def dump(self) -> str:
         with self._lock:
@@ -184,22 +291,63 @@ class AppConfig:
 
     # Performance
     chunk_max_chars: int = 1100
+    mp3_concurrency: int = EDGE_CONCURRENCY  # blocos sintetizados em paralelo (Edge e gTTS)
+    synth_cache_max_mb: int = 200  # cache de blocos em <saída>/.cache (0 = desligado)
+    mp3_concat_mode: str = "auto"  # gTTS: auto|raw|ffmpeg (Edge grava o stream direto)
+
+    def __post_init__(self):
+        # JSON editado à mão pode trazer "1100" ou 1100.0: normaliza uma vez aqui,
+        # e o resto do app lê os campos numéricos sem int(...)
+        for name in ("read_rate", "chunk_max_chars", "mp3_concurrency", "synth_cache_max_mb"):
+            try:
+                setattr(self, name, int(getattr(self, name)))
+            except (TypeError, ValueError):
+                setattr(self, name, getattr(AppConfig, name))
+
+
+# Última config lida/gravada, por mtime do arquivo: evita reler/parsear à toa.
+_CFG_CACHE: Optional[Tuple[int, AppConfig]] = None
+
+
+def _remember_config(cfg: AppConfig) -> None:
+    global _CFG_CACHE
+    try:
+        _CFG_CACHE = (CONFIG_PATH.stat().st_mtime_ns, replace(cfg))
+    except OSError:
+        _CFG_CACHE = None
 
 
 def load_config() -> AppConfig:
-    if CONFIG_PATH.exists():
-        try:
-            data = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
-            allowed = {k: data[k] for k in data if k in AppConfig.__annotations__}
-            return AppConfig(**allowed)
-        except Exception as e:
-            LOG.log("error", f"Falha ao carregar config: {e}")
-    return AppConfig()
+    global _CFG_CACHE
+    try:
+        mtime = CONFIG_PATH.stat().st_mtime_ns
+    except OSError:
+        return AppConfig()
+    if _CFG_CACHE is not None and _CFG_CACHE[0] == mtime:
+        return replace(_CFG_CACHE[1])  # cópia: o App altera o objeto recebido
+    try:
+        raw = CONFIG_PATH.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw.decode("utf-8"))
+        allowed = {k: data[k] for k in data if k in AppConfig.__annotations__}
+        cfg = AppConfig(**allowed)
+    except Exception as e:
+        LOG.log("error", f"Falha ao carregar config: {e}")
+        return AppConfig()
+    _CFG_CACHE = (mtime, replace(cfg))
+    return cfg
 
 
 def save_config(cfg: AppConfig) -> None:
     try:
-        CONFIG_PATH.write_text(json.dumps(asdict(cfg), ensure_ascii=False, indent=2), encoding="utf-8")
+        if orjson is not None:
+            data = orjson.dumps(cfg, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(vars(cfg), ensure_ascii=False, indent=2).encode("utf-8")
+        # grava ao lado e troca atomicamente: queda no meio não corrompe a config
+        tmp = CONFIG_PATH.with_name(CONFIG_PATH.name + ".tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, CONFIG_PATH)
+        _remember_config(cfg)
         LOG.log("info", f"Config salva em {CONFIG_PATH}")
     except Exception as e:
         LOG.log("error", f"Falha ao salvar config: {e}")
@@ -208,10 +356,27 @@ def save_config(cfg: AppConfig) -> None:
 # =========================
 # UTILS
 # =========================
+class Cancelled(RuntimeError):
+    """PARAR pedido pelo usuário: encerra o job sem diálogo de erro."""
+
+    def __init__(self):
+        super().__init__("Operação cancelada pelo usuário.")
+
+
+_RE_FNAME_BAD = re.compile(r'[\\/*?:"<>|]')
+_RE_WS = re.compile(r"\s+")
+_RE_CRLF = re.compile(r"\r\n")
+# mesmos separadores de str.splitlines()
+_RE_LINE_END = re.compile(r"\r\n|[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+_RE_NON_WS = re.compile(r"\S")
+_RE_LINE_END_RARE = re.compile(r"\r(?!\n)|[\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
+
+@functools.lru_cache(maxsize=256)  # função pura; o resumo chama a cada atualização
 def sanitize_filename(name: str, max_len: int = 120) -> str:
     name = (name or "").strip()
-    name = re.sub(r'[\\/*?:"<>|]', "_", name)
-    name = re.sub(r"\s+", " ", name)
+    name = _RE_FNAME_BAD.sub("_", name)
+    name = _RE_WS.sub(" ", name)
     name = name.strip(" .")
     if not name:
         name = "audio"
@@ -219,23 +384,45 @@ def sanitize_filename(name: str, max_len: int = 120) -> str:
 
 
 def pick_first_nonempty_line(text: str) -> str:
-    for ln in text.splitlines():
-        if ln.strip():
-            return ln.strip()
-    return "audio"
+    # só varre até o fim da 1ª linha com texto (sem dividir o buffer inteiro)
+    m = _RE_NON_WS.search(text)
+    if not m:
+        return "audio"
+    end = _RE_LINE_END.search(text, m.start())
+    return text[m.start() : end.start() if end else len(text)].strip()
+
+
+def text_body_for_speech(raw: str, exclude_first_line: bool) -> str:
+    raw = raw.strip()
+    if not raw or not exclude_first_line:
+        return raw
+    # só procura o fim da 1ª linha; o resto é um único slice
+    m = _RE_LINE_END.search(raw)
+    if not m:
+        return raw
+    body = raw[m.end():]
+    if _RE_LINE_END_RARE.search(body):
+        body = "\n".join(body.splitlines())  # separadores raros viram \n, como antes
+    body = body.strip()
+    return body if body else raw
 
 
 def unique_path(folder: Path, filename: str) -> Path:
     base = sanitize_filename(filename)
-    candidate = folder / f"{base}.mp3"
-    if not candidate.exists():
-        return candidate
-    i = 2
-    while True:
-        candidate = folder / f"{base} ({i}).mp3"
-        if not candidate.exists():
-            return candidate
-        i += 1
+    # Uma leitura do diretório em vez de um stat por candidato.
+    # casefold: Windows/macOS não diferenciam maiúsculas no nome do arquivo.
+    try:
+        with os.scandir(folder) as it:
+            existing = {e.name.casefold() for e in it}
+    except OSError:
+        existing = set()
+    if f"{base}.mp3".casefold() not in existing:
+        return folder / f"{base}.mp3"
+    # índices já usados ("base (N).mp3") em uma passada; menor livre >= 2
+    pat = re.compile(re.escape(base.casefold()) + r" \((\d+)\)\.mp3")
+    taken = {int(m.group(1)) for m in map(pat.fullmatch, existing) if m}
+    i = next(i for i in itertools.count(2) if i not in taken)
+    return folder / f"{base} ({i}).mp3"
 
 
 def open_folder(path: Path) -> None:
@@ -250,7 +437,52 @@ def open_folder(path: Path) -> None:
         LOG.log("warn", f"Falha ao abrir pasta: {e}")
 
 
-def ffmpeg_status() -> Tuple[bool, str]:
+def play_audio_file(path: Path) -> None:
+    # Reprodução assíncrona com o que houver no sistema.
+    try:
+        if winsound is not None:
+            winsound.PlaySound(str(path), winsound.SND_FILENAME | winsound.SND_ASYNC)
+            return
+        if sys.platform == "darwin":
+            cmd = ["afplay", str(path)]
+        elif shutil.which("ffplay"):
+            cmd = ["ffplay", "-nodisp", "-autoexit", "-loglevel", "quiet", str(path)]
+        elif shutil.which("paplay"):
+            cmd = ["paplay", str(path)]
+        else:
+            cmd = ["aplay", "-q", str(path)]
+        subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except Exception as e:
+        LOG.log("warn", f"Falha ao tocar amostra: {e}")
+
+
+def temp_parts_dir(needed_bytes: int) -> Optional[str]:
+    # tmpfs pode ser pequeno (Docker: 64 MB): só usa com o dobro do espaço estimado livre.
+    # None = pasta temporária padrão do sistema (em disco).
+    if SHM_DIR is None:
+        return None
+    try:
+        free = shutil.disk_usage(SHM_DIR).free
+    except OSError:
+        return None
+    return SHM_DIR if needed_bytes * 2 <= free else None
+
+
+def pyttsx3_supports_external_loop(engine) -> bool:
+    # startLoop(False)/iterate() só funciona se o driver tiver iterate() gerador
+    # (sapi5, nsss). No espeak (Linux) iterate() é função comum e a síntese só roda
+    # dentro do startLoop dele: nesse caso, runAndWait() por bloco.
+    try:
+        return inspect.isgeneratorfunction(engine.proxy._driver.iterate)
+    except AttributeError:
+        return False
+
+
+# Resultado do teste do FFmpeg por valor de PATH (o teste pode criar processo).
+_FFMPEG_CACHE: dict = {}
+
+
+def _probe_ffmpeg() -> Tuple[bool, str]:
     try:
         exe = shutil.which("ffmpeg")
         if exe:
@@ -260,6 +492,7 @@ def ffmpeg_status() -> Tuple[bool, str]:
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
             check=False,
+            timeout=5,
         )
         if res.returncode == 0:
             return True, "(ffmpeg executável, mas não localizado via which)"
@@ -268,89 +501,483 @@ def ffmpeg_status() -> Tuple[bool, str]:
         return False, f"erro ao testar ffmpeg: {e}"
 
 
+def ffmpeg_status() -> Tuple[bool, str]:
+    key = os.environ.get("PATH", "")
+    status = _FFMPEG_CACHE.get(key)
+    if status is None:
+        status = _FFMPEG_CACHE[key] = _probe_ffmpeg()
+    return status
+
+
+def invalidate_ffmpeg_cache() -> None:
+    """Descarta o resultado memorizado de ffmpeg_status() (ex.: após instalar o FFmpeg)."""
+    _FFMPEG_CACHE.clear()
+
+
 def smart_split_text(text: str, max_chars: int) -> List[str]:
-    s = re.sub(r"\r\n", "\n", text).strip()
+    s = _RE_CRLF.sub("\n", text).strip()
     if not s:
         return []
     chunks: List[str] = []
+    append = chunks.append
     i = 0
     n = len(s)
-    sentence_breaks = set(".!?;:")
     max_chars = max(300, int(max_chars))
+    min_nl = int(max_chars * 0.60)
+    min_break = int(max_chars * 0.55)
 
+    rfind = s.rfind
+    # Busca direto em s com limites [i, end): sem copiar a janela a cada bloco.
     while i < n:
         end = min(i + max_chars, n)
         if end == n:
             chunk = s[i:end].strip()
             if chunk:
-                chunks.append(chunk)
+                append(chunk)
             break
 
-        window = s[i:end]
         cut = -1
 
-        nl = window.rfind("\n")
-        if nl >= int(max_chars * 0.60):
+        nl = rfind("\n", i, end)
+        if nl - i >= min_nl:
             cut = nl + 1
 
         if cut == -1:
-            for k in range(len(window) - 1, int(max_chars * 0.55), -1):
-                if window[k] in sentence_breaks:
-                    cut = k + 1
-                    break
+            k = max(rfind(".", i, end), rfind("!", i, end), rfind("?", i, end), rfind(";", i, end), rfind(":", i, end))
+            if k - i > min_break:
+                cut = k + 1
 
         if cut == -1:
-            sp = window.rfind(" ")
-            if sp >= int(max_chars * 0.55):
+            sp = rfind(" ", i, end)
+            if sp - i >= min_break:
                 cut = sp + 1
 
         if cut == -1:
-            cut = len(window)
+            cut = end
 
-        chunk = s[i : i + cut].strip()
+        chunk = s[i:cut].strip()
         if chunk:
-            chunks.append(chunk)
-        i = i + cut
+            append(chunk)
+        i = cut
 
     return chunks
 
 
+def _write_concat_listing(stream, parts: List[Path]) -> None:
+    # Uma linha por vez direto no stdin do FFmpeg: sem montar a lista inteira.
+    # Prefixo file: obrigatório: com a lista em pipe:0, o demuxer resolveria
+    # caminhos sem protocolo contra a URL "pipe:" (Impossible to open 'pipe:/...').
+    write = stream.write
+    for p in parts:
+        path_str = str(Path(p).absolute()).replace("'", "'\\''")
+        write(f"file 'file:{path_str}'\n".encode("utf-8"))
+
+
+def _ffmpeg_concat_cmd(output: Path) -> List[str]:
+    return [
+        "ffmpeg",
+        "-hide_banner",
+        "-loglevel", "error",
+        "-protocol_whitelist", "pipe,file",
+        "-f", "concat",
+        "-safe", "0",
+        "-i", "pipe:0",
+        "-map", "0:a",  # só áudio: capa/imagem embutida não entra no concat
+        "-c:a", "copy",
+        str(output),
+    ]
+
+
+def _concat_groups_parallel(jobs: List[Tuple[List[Path], Path]], max_procs: int) -> None:
+    # Vários FFmpeg ao mesmo tempo, acompanhados por poll() (sem threads).
+    pending = list(reversed(jobs))
+    running: List[subprocess.Popen] = []
+    try:
+        while pending or running:
+            while pending and len(running) < max_procs:
+                group, out = pending.pop()
+                proc = subprocess.Popen(
+                    _ffmpeg_concat_cmd(out),
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                )
+                _write_concat_listing(proc.stdin, group)  # lista pequena: cabe no buffer do pipe
+                proc.stdin.close()
+                running.append(proc)
+            for proc in [p for p in running if p.poll() is not None]:
+                running.remove(proc)
+                err = proc.stderr.read()
+                proc.stderr.close()
+                if proc.returncode != 0:
+                    msg = err.decode("utf-8", errors="replace").strip()
+                    raise RuntimeError(f"FFmpeg falhou ao concatenar: {msg}")
+            if running:
+                time.sleep(0.01)
+    finally:
+        for proc in running:
+            proc.kill()
+            proc.wait()
+
+
+def _move_part(src: Path, output: Path) -> None:
+    # Parte vinda do cache pode ser hardlink: copiar, para a saída não dividir o inode.
+    if src.stat().st_nlink > 1:
+        shutil.copyfile(src, output)
+    else:
+        shutil.move(str(src), str(output))  # os.replace, ou cópia entre volumes
+
+
 def concat_mp3_ffmpeg(parts: List[Path], output: Path) -> None:
     if not parts:
         raise RuntimeError("Nenhuma parte para concatenar.")
-    with tempfile.TemporaryDirectory() as td:
-        list_path = Path(td) / "list.txt"
-        lines = []
-        for p in parts:
-            path_str = str(p).replace("'", "'\\''")
-            lines.append(f"file '{path_str}'")
-        list_path.write_text("\n".join(lines), encoding="utf-8")
-
-        cmd = [
-            "ffmpeg",
-            "-hide_banner",
-            "-loglevel", "error",
-            "-f", "concat",
-            "-safe", "0",
-            "-i", str(list_path),
-            "-c", "copy",
-            str(output),
-        ]
-        res = subprocess.run(cmd, capture_output=True, text=True)
-        if res.returncode != 0:
-            msg = (res.stderr or res.stdout or "").strip()
-            raise RuntimeError(f"FFmpeg falhou ao concatenar: {msg}")
+    if len(parts) == 1:
+        _move_part(parts[0], output)  # nada a concatenar: sem processo FFmpeg
+        return
+    if len(parts) > FFMPEG_CONCAT_GROUP:
+        # Muitas partes: concat em grupos (em paralelo) e depois dos intermediários.
+        needed = sum(p.stat().st_size for p in parts)  # intermediários ~ soma das partes
+        with tempfile.TemporaryDirectory(dir=temp_parts_dir(needed)) as td:
+            jobs = [
+                (parts[i : i + FFMPEG_CONCAT_GROUP], Path(td) / f"grupo_{k:04d}.mp3")
+                for k, i in enumerate(range(0, len(parts), FFMPEG_CONCAT_GROUP))
+            ]
+            _concat_groups_parallel(jobs, max(1, (os.cpu_count() or 4) // 4))
+            concat_mp3_ffmpeg([out for _, out in jobs], output)
+        return
+    # Lista do concat enviada via stdin (pipe:0): sem pasta/arquivo temporário.
+    proc = subprocess.Popen(
+        _ffmpeg_concat_cmd(output),
+        stdin=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+    try:
+        _write_concat_listing(proc.stdin, parts)
+        proc.stdin.close()
+    except BrokenPipeError:
+        pass  # FFmpeg saiu antes de ler tudo: o erro vem no stderr
+    err = proc.stderr.read()
+    proc.stderr.close()
+    proc.wait()
+    if proc.returncode != 0:
+        msg = (err or b"").decode("utf-8", errors="replace").strip()
+        raise RuntimeError(f"FFmpeg falhou ao concatenar: {msg}")
+
+
+def _copy_file_into(src, out) -> None:
+    # Copia a partir da posição atual de src. Cópia no kernel (os.sendfile)
+    # quando disponível; senão, buffer de 1 MiB.
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(src.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)  # readahead maior
+        except OSError:
+            pass
+    if hasattr(os, "sendfile"):
+        out.flush()
+        offset = src.tell()
+        size = os.fstat(src.fileno()).st_size
+        try:
+            while offset < size:
+                sent = os.sendfile(out.fileno(), src.fileno(), offset, min(size - offset, 1 << 30))
+                if sent == 0:
+                    break
+                offset += sent
+        except OSError:
+            pass  # ex.: macOS só aceita socket como destino
+        if offset >= size:
+            return
+        src.seek(offset)
+    shutil.copyfileobj(src, out, length=1 << 20)
+
+
+def _id3v2_size(f) -> int:
+    # Tamanho da tag ID3v2 no início do arquivo (0 se não houver).
+    head = f.read(10)
+    if head[:3] != b"ID3" or len(head) < 10:
+        return 0
+    size = (head[6] << 21) | (head[7] << 14) | (head[8] << 7) | head[9]
+    return 10 + size + (10 if head[5] & 0x10 else 0)
+
+
+def _append_mp3_part(out, part: Path, first: bool) -> None:
+    # Mantém a tag ID3v2 só da 1ª parte; nas demais ela viraria lixo no meio do stream.
+    with open(part, "rb") as src:
+        src.seek(0 if first else _id3v2_size(src))
+        _copy_file_into(src, out)
 
 
 def concat_mp3_naive(parts: List[Path], output: Path) -> None:
     with open(output, "wb") as out:
-        for p in parts:
-            out.write(p.read_bytes())
+        for i, p in enumerate(parts):
+            _append_mp3_part(out, p, first=(i == 0))
 
 
-async def edge_tts_save_mp3(text: str, out_path: Path, voice: str, rate: str, pitch: str) -> None:
+def _mp3_header_sig(path: Path) -> Optional[Tuple[int, int, int, int]]:
+    # Assinatura do 1º frame MPEG: (versão, layer, sample rate, modo de canal).
+    # Bitrate fica de fora: pode variar frame a frame (VBR) sem quebrar o concat.
+    try:
+        with open(path, "rb") as f:
+            f.seek(_id3v2_size(f))
+            data = f.read(8192)
+    except OSError:
+        return None
+    for k in range(len(data) - 3):
+        if data[k] != 0xFF or (data[k + 1] & 0xE0) != 0xE0:
+            continue
+        b1, b2, b3 = data[k + 1], data[k + 2], data[k + 3]
+        version = (b1 >> 3) & 0x03
+        layer = (b1 >> 1) & 0x03
+        bitrate_idx = b2 >> 4
+        sr_idx = (b2 >> 2) & 0x03
+        if version == 1 or layer == 0 or bitrate_idx == 0x0F or sr_idx == 0x03:
+            continue  # falso sync
+        return version, layer, sr_idx, (b3 >> 6) & 0x03
+    return None
+
+
+class OrderedMp3Writer:
+    """Concat direto feito durante a síntese: cada parte é anexada à saída assim
+    que ela e todas as anteriores ficam prontas (sem etapa final de concat).
+
+    Com check_format, a 1ª parte com formato diferente (ou ilegível) interrompe
+    a escrita: ok vira False e quem chamou concatena tudo no fim, como antes.
+    """
+
+    def __init__(self, parts: List[Path], output: Path, check_format: bool):
+        self.parts = parts
+        self.ok = True
+        self._out = open(output, "wb")
+        self._ready = [False] * len(parts)
+        self._next = 0
+        self._sig: Optional[Tuple[int, int, int, int]] = None
+        self._check = check_format
+
+    @property
+    def complete(self) -> bool:
+        return self.ok and self._next == len(self.parts)
+
+    def part_done(self, idx: int) -> None:
+        if not self.ok:
+            return
+        self._ready[idx] = True
+        while self._next < len(self.parts) and self._ready[self._next]:
+            part = self.parts[self._next]
+            if self._check:
+                sig = _mp3_header_sig(part)
+                if self._next == 0:
+                    self._sig = sig
+                if sig is None or sig != self._sig:
+                    self.ok = False
+                    self.close()
+                    return
+            _append_mp3_part(self._out, part, first=(self._next == 0))
+            self._next += 1
+
+    def close(self) -> None:
+        if not self._out.closed:
+            self._out.close()
+
+
+# =========================
+# CACHE DE SÍNTESE
+# =========================
+class SynthCache:
+    """Blocos já sintetizados, em disco, endereçados por hash de (parâmetros, texto)."""
+
+    def __init__(self, folder: Path, max_bytes: int):
+        self.folder = folder
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.folder.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(params: str, text: str) -> str:
+        h = hashlib.blake2b(digest_size=16)
+        h.update(params.encode("utf-8"))
+        h.update(b"\0")
+        h.update(text.encode("utf-8"))
+        return h.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.folder / f"{key}.mp3"
+
+    def _touch(self, p: Path) -> None:
+        try:
+            os.utime(p)  # mtime = último uso (ordem do LRU)
+        except OSError:
+            pass
+
+    def get_bytes(self, key: str) -> Optional[bytes]:
+        p = self._path(key)
+        try:
+            data = p.read_bytes()
+        except OSError:
+            return None
+        if not data:
+            return None
+        self._touch(p)
+        self.hits += 1
+        return data
+
+    def put_bytes(self, key: str, data: bytes) -> None:
+        if not data:
+            return
+        p = self._path(key)
+        tmp = p.with_name(f"{p.name}.{threading.get_ident()}.tmp")
+        try:
+            tmp.write_bytes(data)
+            os.replace(tmp, p)
+        except OSError as e:
+            LOG.log("warn", f"Cache: falha ao gravar bloco: {e}")
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+
+    def fetch_file(self, key: str, dest: Path) -> bool:
+        p = self._path(key)
+        try:
+            if p.stat().st_size <= 0:
+                return False
+        except OSError:
+            return False
+        try:
+            os.link(p, dest)
+        except OSError:
+            try:
+                shutil.copyfile(p, dest)
+            except OSError:
+                return False
+        self._touch(p)
+        self.hits += 1
+        return True
+
+    def store_file(self, key: str, src: Path) -> None:
+        try:
+            self.put_bytes(key, src.read_bytes())
+        except OSError as e:
+            LOG.log("warn", f"Cache: falha ao ler bloco: {e}")
+
+    def evict(self) -> None:
+        # LRU simples: remove os menos usados até caber no limite.
+        try:
+            entries = [(e.stat().st_mtime, e.stat().st_size, e.path) for e in os.scandir(self.folder) if e.is_file()]
+        except OSError:
+            return
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+                removed += 1
+            except OSError:
+                pass
+        LOG.log("info", f"Cache: {removed} arquivo(s) removido(s) (limite {self.max_bytes // (1 << 20)} MB).")
+
+
+async def edge_tts_synth_bytes(text: str, voice: str, rate: str, pitch: str) -> bytes:
     comm = edge_tts.Communicate(text=text, voice=voice, rate=rate, pitch=pitch)
-    await comm.save(str(out_path))
+    buf = bytearray()
+    async for c in comm.stream():
+        if c["type"] == "audio":
+            buf += c["data"]
+    return bytes(buf)
+
+
+async def edge_tts_save_stream(
+    chunks: List[str],
+    output: Path,
+    voice: str,
+    rate: str,
+    pitch: str,
+    stop_event: threading.Event,
+    pause_event: threading.Event,
+    on_part_done=None,
+    concurrency: int = EDGE_CONCURRENCY,
+    cache: Optional[SynthCache] = None,
+) -> None:
+    # Blocos sintetizados em paralelo (I/O de rede), limitados por semáforo.
+    # O áudio (frames MP3 crus) vai direto para o arquivo final, na ordem dos
+    # blocos: sem MP3 parciais e sem etapa de concatenação.
+    params = f"edge|{voice}|{rate}|{pitch}"
+    sem = asyncio.Semaphore(max(1, int(concurrency)))
+    done = 0
+    pending = {}
+    next_idx = 0
+    resumed: Optional[asyncio.Future] = None
+
+    async def wait_unpaused() -> None:
+        # Pausado: uma única espera bloqueante no executor, compartilhada pelas
+        # tarefas (sem acordar o loop a cada 50 ms). PARAR também seta o evento.
+        nonlocal resumed
+        if pause_event.is_set():
+            return
+        if resumed is None or resumed.done():
+            resumed = asyncio.get_running_loop().run_in_executor(None, pause_event.wait)
+        await asyncio.shield(resumed)
+
+    with open(output, "wb") as out:
+
+        async def bounded(idx: int, chunk: str) -> None:
+            nonlocal done, next_idx
+            async with sem:
+                await wait_unpaused()
+                if stop_event.is_set():
+                    raise Cancelled()
+                key = SynthCache.key(params, chunk) if cache is not None else ""
+                data = cache.get_bytes(key) if cache is not None else None
+                if data is None:
+                    data = await edge_tts_synth_bytes(chunk, voice=voice, rate=rate, pitch=pitch)
+                    if cache is not None:
+                        cache.put_bytes(key, data)
+                pending[idx] = data
+            while next_idx in pending:
+                out.write(pending.pop(next_idx))
+                next_idx += 1
+            done += 1
+            if on_part_done is not None:
+                on_part_done(done)
+
+        tasks = [asyncio.ensure_future(bounded(i, c)) for i, c in enumerate(chunks)]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # gather não cancela os irmãos: parar todos antes de fechar o arquivo
+            for t in tasks:
+                t.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+
+class LoopThread:
+    """Event loop asyncio persistente numa thread daemon (reusado entre jobs)."""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name="asyncio-loop", daemon=True)
+        self._thread.start()
+
+    def run(self, coro):
+        # Bloqueia a thread chamadora (worker) até a coroutine terminar.
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+
+_LOOP_THREAD: Optional[LoopThread] = None
+_LOOP_THREAD_LOCK = threading.Lock()
+
+
+def async_loop() -> LoopThread:
+    global _LOOP_THREAD
+    with _LOOP_THREAD_LOCK:
+        if _LOOP_THREAD is None:
+            _LOOP_THREAD = LoopThread()
+        return _LOOP_THREAD
 
 
 # =========================
@@ -405,6 +1032,8 @@ class App(tk.Tk):
         "pt (alternativo)": "pt",
         "com (alternativo)": "com",
     }
+    TLD_LABELS = tuple(TLD_OPTIONS)
+    CONCAT_MODES = ("auto", "raw", "ffmpeg")
 
     def __init__(self):
         super().__init__()
@@ -412,7 +1041,8 @@ class App(tk.Tk):
         self.geometry("1120x820")
         self.minsize(1020, 760)
 
-        LOG.set_ui_callback(self._append_log_line)
+        # linhas do log para a aba LOG: qualquer thread enfileira, o Tk drena em lote
+        self._log_ui_q: "queue.SimpleQueue[str]" = queue.SimpleQueue()
 
         self.cfg = load_config()
 
@@ -421,10 +1051,15 @@ class App(tk.Tk):
         LOG.log("info", f"Inicializando v{APP_VERSION}")
         LOG.log("info", f"Config: {CONFIG_PATH}")
 
+        # pastas já criadas nesta sessão (dispensa novo mkdir)
+        self._outdir_verified: Set[str] = set()
         self.out_dir = self._resolve_out_dir(initial=True)
 
         self._py_engine = None
         self._py_voices = []
+        self._py_voice_by_name: dict = {}
+        self._preview_tmp: Optional[tempfile.TemporaryDirectory] = None  # amostras com cache desligado
+        self._pyttsx3_last_applied: Optional[Tuple[int, str]] = None  # (rate, voz) já no motor
         self._is_busy = False
 
         self._pause_event = threading.Event()
@@ -433,16 +1068,44 @@ class App(tk.Tk):
         self._current_job = "idle"
         self._restart_after_stop = False
 
+        # progresso: workers só enfileiram; a UI drena a no máximo 10 Hz
+        self._progress_q: "queue.SimpleQueue[Tuple[int, str]]" = queue.SimpleQueue()
+        self._progress_poll_id = None
+        # erro do job: vai para a barra de status na hora; diálogo só um, no fim do job
+        self._last_error: Optional[Tuple[str, str]] = None
+        self._closing = False
+        self._dialog_open = False
+        # None enquanto o teste do FFmpeg roda em segundo plano
+        self._ffmpeg_status: Optional[Tuple[bool, str]] = None
+        # resumo: recálculo adiado enquanto o usuário digita
+        self._summary_after_id = None
+        # splits recentes (resumo e LER/GERAR reaproveitam); LER usa bloco >= 800,
+        # então um cache de uma entrada só alternaria entre os dois tamanhos
+        self._split_cache: "OrderedDict[Tuple[bytes, int], List[str]]" = OrderedDict()
+        self._split_lock = threading.Lock()
+        # split do resumo fora da thread do Tk; token descarta resultados velhos
+        self._bg = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="resumo")
+        self._summary_token = 0
+        # cópia do texto do widget; invalidada a cada <<Modified>>
+        self._text_cache: Optional[str] = None
+
         self._setup_style()
         self._build_ui()
         self._bind_shortcuts()
 
         self.protocol("WM_DELETE_WINDOW", self._on_close)
 
-        self.after(80, self._ensure_outdir_prompt_if_missing)
-        self.after(120, self._init_pyttsx3)
-        self.after(200, self._load_cfg_into_ui_staged)
-        self.after(260, self._refresh_summary)
+        self.after_idle(self._startup_sequence)
+
+    def _startup_sequence(self):
+        # Um único callback ocioso: os passos baratos primeiro, o motor (bloqueante)
+        # depois, e o diálogo modal da pasta de saída por último, com a janela pronta.
+        # teste do FFmpeg já com o mainloop rodando: a thread pode usar after()
+        self._recheck_ffmpeg(invalidate=False)
+        self._load_cfg_into_ui_staged()
+        self._refresh_summary()
+        self._init_pyttsx3()
+        self._ensure_outdir_prompt_if_missing()
 
     # -------- LOG UI --------
     def _append_log_line(self, line: str):
@@ -451,25 +1114,38 @@ class App(tk.Tk):
                 return
             self.txt_log.configure(state="normal")
             self.txt_log.insert("end", line + "\n")
+            # mesmo limite do buffer do LOG: um delete em vez de crescer sem fim
+            if int(self.txt_log.index("end-1c").split(".")[0]) > 5000:
+                self.txt_log.delete("1.0", "end-5000l")
             self.txt_log.see("end")
             self.txt_log.configure(state="disabled")
         except Exception:
             pass
 
     def _on_close(self):
+        if self._closing:
+            return
+        self._closing = True
         LOG.log("info", "Solicitado fechamento do app.")
         try:
             if self._is_busy:
                 self._stop_event.set()
                 self._pause_event.set()
-                time.sleep(0.05)
         except Exception:
             pass
+        self._finalize_close()
+
+    def _finalize_close(self, tries: int = 0):
+        # Espera o worker parar sem bloquear o laço do Tk (até ~1 s).
+        if self._current_job != "idle" and tries < 20:
+            self.after(50, self._finalize_close, tries + 1)
+            return
         try:
             if self._py_engine is not None:
                 self._py_engine.stop()
         except Exception:
             pass
+        self._bg.shutdown(wait=False, cancel_futures=True)
         LOG.log("info", "Encerrando.")
         self.destroy()
 
@@ -479,20 +1155,28 @@ class App(tk.Tk):
         if path:
             p = Path(path)
             try:
-                p.mkdir(parents=True, exist_ok=True)
+                self._ensure_dir(p)
                 return p
             except Exception as e:
                 LOG.log("error", f"Diretório inválido ({path}): {e}")
 
         # fallback
         try:
-            DEFAULT_OUT_DIR.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(DEFAULT_OUT_DIR)
         except Exception:
             pass
         if initial:
             LOG.log("warn", f"Diretório de saída não configurado. Fallback: {DEFAULT_OUT_DIR}")
         return DEFAULT_OUT_DIR
 
+    def _ensure_dir(self, p: Path) -> None:
+        # só um stat se a pasta já foi criada antes (e não foi apagada depois)
+        key = str(p)
+        if key in self._outdir_verified and p.is_dir():
+            return
+        p.mkdir(parents=True, exist_ok=True)
+        self._outdir_verified.add(key)
+
     def _ensure_outdir_prompt_if_missing(self):
         # Se output_dir ainda vazio, perguntar e persistir.
         if (self.cfg.output_dir or "").strip():
@@ -520,6 +1204,7 @@ class App(tk.Tk):
         # atualizar UI
         try:
             self.lbl_outdir.config(text=str(self.out_dir))
+            self.var_outdir_staged.set(str(self.out_dir))
             self.var_status.set(f"Pronto. Saída: {self.out_dir}")
         except Exception:
             pass
@@ -570,6 +1255,9 @@ class App(tk.Tk):
         nb.add(self.tab_cfg, text="Configurações")
         nb.add(self.tab_log, text="LOG")
         nb.add(self.tab_about, text="SOBRE")
+        # LOG e SOBRE só são montadas na primeira vez que a aba é aberta
+        self._lazy_tabs = {str(self.tab_log): self._build_log_tab, str(self.tab_about): self._build_about_tab}
+        nb.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
         # -------- Editor
         toolbar = ttk.Frame(self.tab_main, style="Toolbar.TFrame")
@@ -627,15 +1315,9 @@ class App(tk.Tk):
         self.lbl_engine = ttk.Label(right, text="Leitura: carregando...", style="Hint.TLabel", wraplength=320)
         self.lbl_engine.pack(anchor="w", pady=(14, 0))
 
-        ok_ff, ff_info = ffmpeg_status()
-        ff_txt = "FFmpeg: OK" if ok_ff else "FFmpeg: AUSENTE"
-        self.lbl_ffmpeg = ttk.Label(
-            right,
-            text=f"{ff_txt}\n{ff_info}",
-            style=("Hint.TLabel" if ok_ff else "Danger.TLabel"),
-            wraplength=320,
-        )
+        self.lbl_ffmpeg = ttk.Label(right, wraplength=320)
         self.lbl_ffmpeg.pack(anchor="w", pady=(6, 0))
+        self._update_ffmpeg_label()  # "checando..." até o teste de _startup_sequence
 
         # status + progresso
         status = ttk.Frame(self.tab_main, padding=(12, 8))
@@ -674,14 +1356,15 @@ class App(tk.Tk):
         self.var_read_voice_staged = tk.StringVar(value=self.cfg.read_voice_name or "(carregando...)")
         self.cmb_voice = ttk.Combobox(row, textvariable=self.var_read_voice_staged, state="readonly", width=52)
         self.cmb_voice.pack(side="left", padx=(8, 18))
+        self.cmb_voice.bind("<<ComboboxSelected>>", self._on_voice_selected)
 
         ttk.Label(row, text="Velocidade:").pack(side="left")
-        self.var_read_rate_staged = tk.IntVar(value=int(self.cfg.read_rate))
+        self.var_read_rate_staged = tk.IntVar(value=self.cfg.read_rate)
         self.sld_rate = ttk.Scale(row, from_=120, to=240, orient="horizontal", length=240)
         self.sld_rate.set(self.var_read_rate_staged.get())
         self.sld_rate.pack(side="left", padx=(8, 8))
         ttk.Label(row, textvariable=self.var_read_rate_staged, width=4).pack(side="left")
-        self.sld_rate.configure(command=lambda v: self.var_read_rate_staged.set(int(float(v))))
+        self.sld_rate.configure(command=self._on_rate_slide)
 
         self.lbl_read_warn = ttk.Label(g1, text="", style="Danger.TLabel")
         self.lbl_read_warn.pack(anchor="w", pady=(8, 0))
@@ -717,7 +1400,7 @@ class App(tk.Tk):
 
         ttk.Label(row2b, text="gTTS (fallback): endpoint:", style="Hint.TLabel").pack(side="left")
         self.var_gt_tld_staged = tk.StringVar(value=self.cfg.gt_tld_label)
-        self.cmb_tld = ttk.Combobox(row2b, textvariable=self.var_gt_tld_staged, values=list(self.TLD_OPTIONS.keys()), state="readonly", width=18)
+        self.cmb_tld = ttk.Combobox(row2b, textvariable=self.var_gt_tld_staged, values=self.TLD_LABELS, state="readonly", width=18)
         self.cmb_tld.pack(side="left", padx=(8, 18))
 
         ttk.Label(row2b, text="Velocidade:", style="Hint.TLabel").pack(side="left")
@@ -733,12 +1416,26 @@ class App(tk.Tk):
         row3 = ttk.Frame(g3)
         row3.pack(fill="x")
         ttk.Label(row3, text="Tamanho do bloco (chars):").pack(side="left")
-        self.var_chunk_staged = tk.IntVar(value=int(self.cfg.chunk_max_chars))
+        self.var_chunk_staged = tk.IntVar(value=self.cfg.chunk_max_chars)
         self.sld_chunk = ttk.Scale(row3, from_=500, to=2500, orient="horizontal", length=340)
         self.sld_chunk.set(self.var_chunk_staged.get())
         self.sld_chunk.pack(side="left", padx=(8, 8))
         ttk.Label(row3, textvariable=self.var_chunk_staged, width=5).pack(side="left")
-        self.sld_chunk.configure(command=lambda v: self._on_chunk_slide(v))
+
+        ttk.Label(row3, text="Blocos simultâneos (MP3):").pack(side="left", padx=(18, 0))
+        self.var_concurrency_staged = tk.IntVar(value=self.cfg.mp3_concurrency)
+        self.spn_concurrency = ttk.Spinbox(row3, from_=1, to=8, textvariable=self.var_concurrency_staged, width=4, state="readonly")
+        self.spn_concurrency.pack(side="left", padx=(8, 0))
+        self.sld_chunk.configure(command=self._on_chunk_slide)
+
+        row4 = ttk.Frame(g3)
+        row4.pack(fill="x", pady=(8, 0))
+        ttk.Label(row4, text="Concatenação (gTTS):").pack(side="left")
+        self.var_concat_mode_staged = tk.StringVar(value=self.cfg.mp3_concat_mode)
+        ttk.Combobox(
+            row4, textvariable=self.var_concat_mode_staged, values=self.CONCAT_MODES, state="readonly", width=8
+        ).pack(side="left", padx=(8, 8))
+        ttk.Label(row4, text="auto = direta se as partes tiverem o mesmo formato; senão FFmpeg", style="Hint.TLabel").pack(side="left")
 
         actions = ttk.Frame(cfg)
         actions.pack(fill="x", pady=(14, 0))
@@ -751,7 +1448,16 @@ class App(tk.Tk):
 
         ttk.Label(actions, text="Só vale depois de SALVAR.", style="Hint.TLabel").pack(side="left")
 
-        # -------- LOG TAB
+        self.after(50, lambda: self.txt.focus_set())
+        self.btn_pause.config(state="disabled")
+        self.btn_stop.config(state="disabled")
+
+    def _on_tab_changed(self, evt):
+        build = self._lazy_tabs.pop(evt.widget.select(), None)
+        if build is not None:
+            build()
+
+    def _build_log_tab(self):
         logwrap = ttk.Frame(self.tab_log, padding=12)
         logwrap.pack(fill="both", expand=True)
 
@@ -775,7 +1481,12 @@ class App(tk.Tk):
         sb_y.pack(fill="y", side="right")
         self.txt_log.configure(yscrollcommand=sb_y.set)
 
-        # -------- ABOUT TAB
+        # preencher log UI com o que já existe (buffer em memória) e passar a receber as novas linhas
+        self._append_log_line("--- LOG INICIAL ---")
+        self._append_log_line(LOG.attach_ui(self._log_ui_q.put))
+        self.after(120, self._drain_log_queue)
+
+    def _build_about_tab(self):
         about = ttk.Frame(self.tab_about, padding=18)
         about.pack(fill="both", expand=True)
 
@@ -790,13 +1501,18 @@ class App(tk.Tk):
 
         ttk.Button(about, text="ABRIR SITE (cmaker.com.br)", command=lambda: self._open_url("https://cmaker.com.br")).pack(anchor="w", pady=(14, 0))
 
-        self.after(50, lambda: self.txt.focus_set())
-        self.btn_pause.config(state="disabled")
-        self.btn_stop.config(state="disabled")
-
-        # preencher log UI com o que já existe
-        self.after(100, lambda: self._append_log_line("--- LOG INICIAL ---"))
-        self.after(120, lambda: self._append_log_line(LOG.dump()))
+    def _drain_log_queue(self):
+        batch = []
+        get = self._log_ui_q.get_nowait
+        try:
+            while len(batch) < 500:
+                batch.append(get())
+        except queue.Empty:
+            pass
+        if batch:
+            self._append_log_line("\n".join(batch))
+        if not self._closing:
+            self.after(120, self._drain_log_queue)
 
     def _open_url(self, url: str):
         LOG.log("info", f"Abrindo URL: {url}")
@@ -833,6 +1549,7 @@ class App(tk.Tk):
         if lf is None:
             messagebox.showerror("Erro", "Arquivo de log não configurado.")
             return
+        LOG.flush()  # o arquivo fica em buffer: garantir que esteja completo ao abrir
         open_folder(Path(lf).parent)
 
     def browse_outdir(self):
@@ -850,9 +1567,17 @@ class App(tk.Tk):
         self.bind("<Escape>", lambda e: self.stop_job())
         self.bind("<F6>", lambda e: self.pause_job())
 
+    # O Scale chama a cada pixel arrastado: só grava quando o inteiro muda.
+    def _on_rate_slide(self, v):
+        n = int(float(v))
+        if n != self.var_read_rate_staged.get():
+            self.var_read_rate_staged.set(n)
+
     def _on_chunk_slide(self, v):
-        self.var_chunk_staged.set(int(float(v)))
-        self._refresh_summary()
+        # valor staged: o resumo usa a config aplicada e é refeito no SALVAR CONFIG
+        n = int(float(v))
+        if n != self.var_chunk_staged.get():
+            self.var_chunk_staged.set(n)
 
     def _set_progress(self, pct: int):
         pct = max(0, min(100, int(pct)))
@@ -862,6 +1587,34 @@ class App(tk.Tk):
     def _reset_progress(self):
         self._set_progress(0)
 
+    def _post_progress(self, pct: int, msg: str = ""):
+        # Chamado das threads de trabalho: não toca no Tk.
+        self._progress_q.put((pct, msg))
+
+    def _start_progress_poll(self):
+        if self._progress_poll_id is None:
+            self._progress_poll_id = self.after(100, self._poll_progress)
+
+    def _poll_progress(self):
+        last = None
+        last_msg = ""
+        while True:
+            try:
+                last = self._progress_q.get_nowait()
+            except queue.Empty:
+                break
+            if last[1]:
+                last_msg = last[1]
+        if last is not None:
+            self._set_progress(last[0])
+            # mensagens atrasadas não sobrescrevem o status final do job
+            if last_msg and self._is_busy:
+                self.var_status.set(last_msg)
+        if self._current_job != "idle" or not self._progress_q.empty():
+            self._progress_poll_id = self.after(100, self._poll_progress)
+        else:
+            self._progress_poll_id = None
+
     def _load_cfg_into_ui_staged(self):
         self.var_exclude_first_staged.set(bool(self.cfg.exclude_first_line))
 
@@ -875,11 +1628,13 @@ class App(tk.Tk):
         self.var_gt_tld_staged.set(self.cfg.gt_tld_label)
         self.var_gt_speed_staged.set(self.cfg.gt_speed)
 
-        self.var_read_rate_staged.set(int(self.cfg.read_rate))
+        self.var_read_rate_staged.set(self.cfg.read_rate)
         self.sld_rate.set(self.var_read_rate_staged.get())
 
-        self.var_chunk_staged.set(int(self.cfg.chunk_max_chars))
+        self.var_chunk_staged.set(self.cfg.chunk_max_chars)
         self.sld_chunk.set(self.var_chunk_staged.get())
+        self.var_concurrency_staged.set(self.cfg.mp3_concurrency)
+        self.var_concat_mode_staged.set(self.cfg.mp3_concat_mode)
 
         if self.cfg.read_voice_name:
             self.var_read_voice_staged.set(self.cfg.read_voice_name)
@@ -901,6 +1656,8 @@ class App(tk.Tk):
             LOG.log("error", f"SALVAR CONFIG falhou: diretório inválido ({outdir}): {e}")
             return
 
+        before = replace(self.cfg)
+        prev_out_dir = self.out_dir
         self.cfg.output_dir = outdir
         self.out_dir = Path(outdir)
         self.lbl_outdir.config(text=str(self.out_dir))
@@ -918,30 +1675,75 @@ class App(tk.Tk):
         self.cfg.read_rate = int(self.var_read_rate_staged.get())
         self.cfg.read_voice_name = self.var_read_voice_staged.get()
         self.cfg.chunk_max_chars = int(self.var_chunk_staged.get())
+        self.cfg.mp3_concurrency = max(1, min(8, int(self.var_concurrency_staged.get())))
+        mode = self.var_concat_mode_staged.get()
+        self.cfg.mp3_concat_mode = mode if mode in self.CONCAT_MODES else "auto"
 
-        save_config(self.cfg)
+        # só grava se algo mudou (dataclass compara campo a campo)
+        if self.cfg != before:
+            save_config(self.cfg)
+        else:
+            LOG.log("info", "Config sem alterações: arquivo não regravado.")
 
         # log file preferencialmente na saída
-        try:
-            LOG.set_log_file(self.out_dir / "tts_clipboard_mp3.log")
-            LOG.log("info", f"Log file definido: {self.out_dir / 'tts_clipboard_mp3.log'}")
-        except Exception:
-            pass
+        if self.out_dir != prev_out_dir or getattr(LOG, "_log_file", None) is None:
+            try:
+                LOG.set_log_file(self.out_dir / "tts_clipboard_mp3.log")
+                LOG.log("info", f"Log file definido: {self.out_dir / 'tts_clipboard_mp3.log'}")
+            except Exception:
+                pass
 
-        self._reinit_pyttsx3()
+        self._recheck_ffmpeg()
+        # recriar o motor SAPI custa centenas de ms: só quando voz/velocidade mudaram
+        tts_changed = (before.read_rate, before.read_voice_name) != (self.cfg.read_rate, self.cfg.read_voice_name)
+        if tts_changed or self._py_engine is None:
+            self._reinit_pyttsx3()
+        else:
+            self._apply_pyttsx3_settings_from_cfg()
         self.var_status.set("Config salva e aplicada.")
         LOG.log("info", "Config salva e aplicada.")
         self._refresh_summary()
 
+    def _update_ffmpeg_label(self):
+        if self._ffmpeg_status is None:
+            self.lbl_ffmpeg.config(text="FFmpeg: checando...", style="Hint.TLabel")
+            return
+        ok_ff, ff_info = self._ffmpeg_status
+        ff_txt = "FFmpeg: OK" if ok_ff else "FFmpeg: AUSENTE"
+        self.lbl_ffmpeg.config(
+            text=f"{ff_txt}\n{ff_info}",
+            style=("Hint.TLabel" if ok_ff else "Danger.TLabel"),
+        )
+
+    def _recheck_ffmpeg(self, invalidate: bool = True):
+        # "ffmpeg -version" sobe um processo: roda fora da thread do Tk
+        if invalidate:
+            invalidate_ffmpeg_cache()
+        self._ffmpeg_status = None
+        self._update_ffmpeg_label()
+
+        def probe():
+            status = ffmpeg_status()
+            if not self._closing:
+                self.after(0, self._set_ffmpeg_status, status)
+
+        threading.Thread(target=probe, daemon=True, name="ffmpeg-probe").start()
+
+    def _set_ffmpeg_status(self, status: Tuple[bool, str]):
+        self._ffmpeg_status = status
+        self._update_ffmpeg_label()
+
     def restart_engine(self):
         if self._is_busy:
             return
+        self._recheck_ffmpeg()
+        self._py_voices = []  # força nova enumeração de vozes
         self._reinit_pyttsx3()
         self.var_status.set("Motor reiniciado.")
         LOG.log("warn", "Motor reiniciado manualmente.")
 
     def pause_job(self):
-        if not self._is_busy:
+        if not self._is_busy or self._current_job == "preview":
             return
         if self._pause_event.is_set():
             self._pause_event.clear()
@@ -955,7 +1757,7 @@ class App(tk.Tk):
             LOG.log("info", "Continuando...")
 
     def stop_job(self):
-        if not self._is_busy:
+        if not self._is_busy or self._current_job == "preview":
             return
         self._restart_after_stop = True
         self._stop_event.set()
@@ -976,45 +1778,132 @@ class App(tk.Tk):
     def _end_job_cleanup(self):
         self._current_job = "idle"
         self._reset_job_flags()
-        self.after(0, lambda: self.btn_pause.config(text="PAUSAR"))
+        if self._last_error is not None:
+            self.after(0, self._show_last_error)
+        self.after(0, functools.partial(self.btn_pause.config, text="PAUSAR"))
         if self._restart_after_stop:
             self._restart_after_stop = False
             self.after(50, self._reinit_pyttsx3)
 
+    def _show_last_error(self):
+        # Um modal por vez: showerror roda um laço de eventos aninhado.
+        if self._dialog_open or self._last_error is None:
+            return
+        title, msg = self._last_error
+        self._last_error = None
+        self._dialog_open = True
+        try:
+            messagebox.showerror(title, msg)
+        finally:
+            self._dialog_open = False
+
     def _on_text_modified(self, _evt=None):
         if self.txt.edit_modified():
-            self._refresh_summary()
+            self._text_cache = None
+            self.lbl_len.config(text=f"Caracteres: {self._text_len()}")
+            if self._summary_after_id is not None:
+                self.after_cancel(self._summary_after_id)
+            self._summary_after_id = self.after(150, self._refresh_summary)
             self.txt.edit_modified(False)
 
+    def _estimate_chunks(self, text: str, exclude_first_line: bool, max_chars: int) -> int:
+        # roda no executor de fundo (1 worker): não tocar em widgets aqui
+        body = text_body_for_speech(text, exclude_first_line)
+        if not body:
+            return 0
+        return len(self._get_chunks(body, max_chars))
+
+    def _get_chunks(self, body: str, max_chars: int) -> List[str]:
+        # Chamado do executor do resumo e da thread do Tk (LRU protegido por lock).
+        key = (hashlib.blake2b(body.encode("utf-8"), digest_size=16).digest(), max_chars)
+        with self._split_lock:
+            chunks = self._split_cache.get(key)
+            if chunks is not None:
+                self._split_cache.move_to_end(key)
+                return chunks
+        chunks = smart_split_text(body, max_chars=max_chars)
+        with self._split_lock:
+            self._split_cache[key] = chunks
+            while len(self._split_cache) > SPLIT_CACHE_SIZE:
+                self._split_cache.popitem(last=False)
+        return chunks
+
     def _refresh_summary(self):
-        text = self.txt.get("1.0", "end-1c")
-        self.lbl_len.config(text=f"Caracteres: {len(text)}")
-        title = pick_first_nonempty_line(text) if text.strip() else "(vazio)"
-        title = sanitize_filename(title)
-        self.lbl_name.config(text=f"Nome do MP3: {title if title else '(vazio)'}")
-        body = self._get_text_to_speak(use_applied_cfg=True)
-        est = len(smart_split_text(body, max_chars=int(self.cfg.chunk_max_chars))) if body else 0
+        self._summary_after_id = None
+        self.lbl_len.config(text=f"Caracteres: {self._text_len()}")
+        first = self._first_line_title()
+        self._summary_token += 1  # descarta estimativa ainda pendente
+        token = self._summary_token
+        if not first:
+            # caixa vazia (estado comum): nada a dividir
+            self.lbl_name.config(text="Nome do MP3: (vazio)")
+            self.lbl_chunks.config(text="Blocos estimados: 0")
+            return
+        title = sanitize_filename(first)
+        self.lbl_name.config(text=f"Nome do MP3: {title}")
+        text = self._text_snapshot()  # leitura do widget só na thread do Tk
+        fut = self._bg.submit(
+            self._estimate_chunks, text, bool(self.cfg.exclude_first_line), self.cfg.chunk_max_chars
+        )
+        fut.add_done_callback(lambda f: self.after(0, self._apply_chunk_estimate, token, f))
+
+    def _text_snapshot(self) -> str:
+        # uma única cópia do buffer por edição, compartilhada por resumo/LER/GERAR
+        if self._text_cache is None:
+            self._text_cache = self.txt.get("1.0", "end-1c")
+        return self._text_cache
+
+    def _text_len(self) -> int:
+        # o Tcl já sabe o tamanho: evita copiar o buffer inteiro para uma str
+        n = self.txt.count("1.0", "end-1c", "chars")
+        if isinstance(n, tuple):
+            n = n[0]
+        return int(n or 0)
+
+    def _first_line_title(self) -> str:
+        """Primeira linha não vazia lida direto do widget ("" se não houver texto)."""
+        first = self.txt.get("1.0", "1.0 lineend").strip()
+        if first:
+            return first
+        idx = self.txt.search(r"\S", "1.0", stopindex="end", regexp=True)
+        if not idx:
+            return ""
+        return self.txt.get(idx, f"{idx} lineend").strip()
+
+    def _apply_chunk_estimate(self, token: int, fut: "concurrent.futures.Future[int]"):
+        if token != self._summary_token or fut.cancelled():
+            return
+        try:
+            est = fut.result()
+        except Exception as e:
+            LOG.log("warn", f"Falha ao estimar blocos: {e}")
+            return
         self.lbl_chunks.config(text=f"Blocos estimados: {est}")
 
     def clear_text(self):
         if self._is_busy:
             return
         self.txt.delete("1.0", "end")
+        self._text_cache = ""
         self.var_status.set("Texto limpo.")
         LOG.log("info", "Texto limpo.")
         self._refresh_summary()
         self._reset_progress()
 
     def _get_text_to_speak(self, use_applied_cfg: bool) -> str:
-        raw = self.txt.get("1.0", "end-1c").strip()
-        if not raw:
-            return ""
+        raw = self._text_snapshot()
         exclude = self.cfg.exclude_first_line if use_applied_cfg else bool(self.var_exclude_first_staged.get())
-        if exclude:
-            lines = raw.splitlines()
-            body = "\n".join(lines[1:]).strip()
-            return body if body else raw
-        return raw
+        return text_body_for_speech(raw, exclude)
+
+    def _open_synth_cache(self) -> Optional[SynthCache]:
+        max_mb = self.cfg.synth_cache_max_mb
+        if max_mb <= 0:
+            return None
+        try:
+            return SynthCache(self.out_dir / ".cache", max_mb << 20)
+        except Exception as e:
+            LOG.log("warn", f"Cache de síntese indisponível: {e}")
+            return None
 
     def _set_busy(self, busy: bool, msg: str = ""):
         self._is_busy = busy
@@ -1025,8 +1914,10 @@ class App(tk.Tk):
         read_enabled = (pyttsx3 is not None and self._py_engine is not None and not busy)
         self.btn_read.config(state="normal" if read_enabled else "disabled")
 
-        self.btn_pause.config(state="normal" if busy else "disabled")
-        self.btn_stop.config(state="normal" if busy else "disabled")
+        # amostra da voz é curta e não pode ser pausada/parada: botões só para LER/GERAR
+        job_ctrl = busy and self._current_job != "preview"
+        self.btn_pause.config(state="normal" if job_ctrl else "disabled")
+        self.btn_stop.config(state="normal" if job_ctrl else "disabled")
 
         if msg:
             self.var_status.set(msg)
@@ -1039,6 +1930,11 @@ class App(tk.Tk):
             self.lbl_read_warn.config(text="Instale: pip install pyttsx3")
             LOG.log("error", "pyttsx3 ausente. Leitura offline indisponível.")
             return
+        # O motor fica na thread do Tk: SAPI (COM/STA) e NSSpeechSynthesizer entregam
+        # eventos pelo laço de mensagens dela. Só garante que a janela já foi desenhada
+        # antes do carregamento (que bloqueia).
+        self.lbl_engine.config(text="Leitura: carregando...")
+        self.update_idletasks()
         self._reinit_pyttsx3()
 
     def _reinit_pyttsx3(self):
@@ -1051,6 +1947,7 @@ class App(tk.Tk):
                 except Exception:
                     pass
                 self._py_engine = None
+            self._pyttsx3_last_applied = None
             self._py_engine = pyttsx3.init()
             self._load_voices_into_ui()
             self._apply_pyttsx3_settings_from_cfg()
@@ -1068,19 +1965,22 @@ class App(tk.Tk):
     def _load_voices_into_ui(self):
         if self._py_engine is None:
             return
-        voices = self._py_engine.getProperty("voices") or []
-        self._py_voices = []
-        names = []
-        for v in voices:
-            vid = getattr(v, "id", "")
-            vname = getattr(v, "name", "") or str(vid)
-            names.append(vname)
-            self._py_voices.append({"id": vid, "name": vname})
+        # Enumeração via COM/SAPI é lenta: feita uma vez (REINICIAR MOTOR refaz).
+        if not self._py_voices:
+            voices = self._py_engine.getProperty("voices") or []
+            self._py_voices = [
+                {"id": getattr(v, "id", ""), "name": getattr(v, "name", "") or str(getattr(v, "id", ""))}
+                for v in voices
+            ]
+            # reversed: com nomes repetidos, vale o primeiro (como na busca linear antiga)
+            self._py_voice_by_name = {v["name"]: v["id"] for v in reversed(self._py_voices)}
+        names = [v["name"] for v in self._py_voices]
 
         if names:
             self.cmb_voice["values"] = names
-            if self.var_read_voice_staged.get() not in names:
-                if self.cfg.read_voice_name in names:
+            # o dict já tem todos os nomes: pertinência em O(1)
+            if self.var_read_voice_staged.get() not in self._py_voice_by_name:
+                if self.cfg.read_voice_name in self._py_voice_by_name:
                     self.var_read_voice_staged.set(self.cfg.read_voice_name)
                 else:
                     self.var_read_voice_staged.set(names[0])
@@ -1088,18 +1988,73 @@ class App(tk.Tk):
             self.var_read_voice_staged.set("(nenhuma voz encontrada)")
             LOG.log("warn", "Nenhuma voz encontrada no pyttsx3/SAPI.")
 
+    def _on_voice_selected(self, _evt=None):
+        # Amostra da voz: sintetizada uma vez e guardada em <saída>/.cache
+        # (entra no mesmo limite de tamanho do cache de blocos). Com o cache
+        # desligado (0 MB), fica numa pasta temporária apagada ao sair do app.
+        if self._is_busy or self._py_engine is None:
+            return
+        voice_id = self._py_voice_by_name.get(self.var_read_voice_staged.get())
+        if not voice_id:
+            return
+        rate = int(self.var_read_rate_staged.get())
+        key = hashlib.blake2b(f"{voice_id}|{rate}".encode("utf-8"), digest_size=8).hexdigest()
+        if self.cfg.synth_cache_max_mb > 0:
+            folder = self.out_dir / ".cache"
+        else:
+            if self._preview_tmp is None:
+                self._preview_tmp = tempfile.TemporaryDirectory(prefix="tts_preview_")
+            folder = Path(self._preview_tmp.name)
+        path = folder / f"preview_{key}.wav"
+        if path.exists():
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+            play_audio_file(path)
+            return
+
+        # 1ª vez desta voz/velocidade: síntese numa thread (como em LER AGORA).
+        # Ocupado enquanto isso: LER AGORA não pode usar o motor ao mesmo tempo.
+        self._current_job = "preview"
+        self._set_busy(True, "Gerando amostra da voz...")  # PAUSAR/PARAR ficam desabilitados
+        engine = self._py_engine
+
+        def worker():
+            ok = False
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                engine.setProperty("voice", voice_id)
+                engine.setProperty("rate", rate)
+                engine.save_to_file(PREVIEW_TEXT, str(path))
+                engine.runAndWait()
+                ok = path.exists()
+            except Exception as e:
+                LOG.log("warn", f"Falha ao gerar amostra da voz: {e}")
+            finally:
+                self._pyttsx3_last_applied = None
+                try:
+                    self._apply_pyttsx3_settings_from_cfg()  # amostra não aplica a config
+                except Exception:
+                    pass
+                self.after(0, self._set_busy, False, "Amostra da voz." if ok else "Amostra indisponível.")
+                self._end_job_cleanup()
+            if ok:
+                play_audio_file(path)
+
+        threading.Thread(target=worker, daemon=True).start()
+
     def _apply_pyttsx3_settings_from_cfg(self):
         if self._py_engine is None:
             return
-        self._py_engine.setProperty("rate", int(self.cfg.read_rate))
-        sel_name = self.cfg.read_voice_name
-        voice_id = None
-        for v in self._py_voices:
-            if v["name"] == sel_name:
-                voice_id = v["id"]
-                break
+        sig = (self.cfg.read_rate, self.cfg.read_voice_name)
+        if sig == self._pyttsx3_last_applied:
+            return  # nada mudou: evita ida e volta ao COM/SAPI
+        self._py_engine.setProperty("rate", sig[0])
+        voice_id = self._py_voice_by_name.get(sig[1])
         if voice_id:
             self._py_engine.setProperty("voice", voice_id)
+        self._pyttsx3_last_applied = sig
 
     def read_now(self):
         if self._is_busy:
@@ -1115,37 +2070,63 @@ class App(tk.Tk):
         self._reset_job_flags()
         self._current_job = "read"
         self.after(0, self._reset_progress)
+        self._start_progress_poll()
 
-        chunks = smart_split_text(text_to_speak, max_chars=max(800, int(self.cfg.chunk_max_chars)))
+        chunks = self._get_chunks(text_to_speak, max(800, self.cfg.chunk_max_chars))
         total = max(1, len(chunks))
         LOG.log("info", f"Leitura iniciada: {total} blocos")
 
         def worker():
-            self.after(0, lambda: self._set_busy(True, f"Lendo... (0/{total})"))
+            self.after(0, self._set_busy, True, f"Lendo... (0/{total})")
+            engine = self._py_engine
+            loop_started = False
             try:
                 self._apply_pyttsx3_settings_from_cfg()
+                external = pyttsx3_supports_external_loop(engine)
+                if external:
+                    # Loop não bloqueante: PARAR age em ~50 ms, não só ao fim do bloco.
+                    engine.startLoop(False)
+                    loop_started = True
+                # locais: evita LOAD_ATTR repetido no laço
+                stop_event = self._stop_event
+                stop_is_set = stop_event.is_set
+                pause_wait = self._pause_event.wait
+                post = self._post_progress
+                say, iterate, is_busy = engine.say, engine.iterate, engine.isBusy
                 for idx, chunk in enumerate(chunks, start=1):
-                    if self._stop_event.is_set():
+                    if stop_is_set():
                         break
-                    self._pause_event.wait()
-                    if self._stop_event.is_set():
+                    pause_wait()
+                    if stop_is_set():
                         break
-                    pct = int((idx / total) * 100)
-                    self.after(0, lambda i=idx, p=pct: (self.var_status.set(f"Lendo... ({i}/{total})"), self._set_progress(p)))
-                    self._py_engine.say(chunk)
-                    self._py_engine.runAndWait()
+                    post(idx * 100 // total, f"Lendo... ({idx}/{total})")
+                    say(chunk)
+                    if external:
+                        while is_busy():
+                            iterate()
+                            if stop_event.wait(0.05):
+                                engine.stop()
+                                break
+                    else:
+                        engine.runAndWait()  # PARAR: stop_job chama engine.stop()
 
                 if self._stop_event.is_set():
-                    self.after(0, lambda: self._set_busy(False, "Leitura cancelada."))
+                    self.after(0, self._set_busy, False, "Leitura cancelada.")
                     LOG.log("warn", "Leitura cancelada.")
                 else:
-                    self.after(0, lambda: (self._set_progress(100), self._set_busy(False, "Leitura concluída.")))
+                    self._post_progress(100)
+                    self.after(0, self._set_busy, False, "Leitura concluída.")
                     LOG.log("info", "Leitura concluída.")
             except Exception as e:
-                self.after(0, lambda: self._set_busy(False, f"Falhou: {e}"))
+                self.after(0, self._set_busy, False, f"Falhou: {e}")
                 LOG.log("error", f"Erro em leitura: {e}")
-                self.after(0, lambda: messagebox.showerror("Erro ao ler", str(e)))
+                self._last_error = ("Erro ao ler", str(e))
             finally:
+                if loop_started:
+                    try:
+                        engine.endLoop()
+                    except Exception:
+                        pass
                 self._end_job_cleanup()
 
         threading.Thread(target=worker, daemon=True).start()
@@ -1154,8 +2135,8 @@ class App(tk.Tk):
         if self._is_busy:
             return
 
-        raw = self.txt.get("1.0", "end-1c").strip()
-        if not raw:
+        raw = self._text_snapshot()
+        if not raw or raw.isspace():  # isspace para no 1º caractere visível; sem copiar
             messagebox.showerror("Erro", "Cole um texto na caixa (Ctrl+V).")
             return
 
@@ -1170,10 +2151,11 @@ class App(tk.Tk):
         self._reset_job_flags()
         self._current_job = "gen"
         self.after(0, self._reset_progress)
+        self._start_progress_poll()
 
-        chunks = smart_split_text(text_to_speak, max_chars=int(self.cfg.chunk_max_chars))
+        chunks = self._get_chunks(text_to_speak, self.cfg.chunk_max_chars)
         total = max(1, len(chunks))
-        ok_ff, ffmsg = ffmpeg_status()
+        ok_ff, ffmsg = self._ffmpeg_status or ffmpeg_status()
         if not ok_ff:
             LOG.log("warn", f"FFmpeg ausente: {ffmsg}")
 
@@ -1183,64 +2165,137 @@ class App(tk.Tk):
         pitch = (self.cfg.mp3_pitch or "+0Hz").strip()
         tld = self.TLD_OPTIONS.get(self.cfg.gt_tld_label, "com.br")
         slow = True if self.cfg.gt_speed == "Lenta" else False
+        use_edge = backend == "edge" and edge_tts is not None
+        concurrency = max(1, self.cfg.mp3_concurrency)
+        concat_mode = self.cfg.mp3_concat_mode if self.cfg.mp3_concat_mode in self.CONCAT_MODES else "auto"
 
         LOG.log("info", f"Conversão MP3 iniciada: {total} blocos → {mp3_path.name} (out={self.out_dir})")
-        LOG.log("info", f"MP3 cfg: backend={backend} voice={voice} rate={rate} pitch={pitch} | gTTS tld={tld} slow={slow}")
+        LOG.log("info", f"MP3 cfg: backend={backend} voice={voice} rate={rate} pitch={pitch} paralelo={concurrency} | gTTS tld={tld} slow={slow}")
 
         def worker():
-            self.after(0, lambda: self._set_busy(True, f"Gerando MP3... (0/{total})"))
+            self.after(0, self._set_busy, True, f"Gerando MP3... (0/{total})")
+            naive_unsafe = False
+            cache = self._open_synth_cache()
             try:
-                with tempfile.TemporaryDirectory() as td:
-                    td_path = Path(td)
-                    parts: List[Path] = []
-
-                    for idx, chunk in enumerate(chunks, start=1):
-                        if self._stop_event.is_set():
-                            raise RuntimeError("Operação cancelada pelo usuário.")
-                        self._pause_event.wait()
-                        if self._stop_event.is_set():
-                            raise RuntimeError("Operação cancelada pelo usuário.")
-
-                        gen_pct = int((idx / total) * 95)
-                        self.after(0, lambda i=idx, p=gen_pct: (self.var_status.set(f"Gerando... ({i}/{total})"), self._set_progress(p)))
-
-                        part = td_path / f"part_{idx:04d}.mp3"
-
-                        if backend == "edge" and edge_tts is not None:
-                            asyncio.run(edge_tts_save_mp3(chunk, part, voice=voice, rate=rate, pitch=pitch))
+                if use_edge:
+                    post = self._post_progress
+
+                    def on_part_done(done: int):
+                        post(done * 99 // total, f"Gerando... ({done}/{total})")
+
+                    try:
+                        async_loop().run(edge_tts_save_stream(
+                            chunks, mp3_path, voice=voice, rate=rate, pitch=pitch,
+                            stop_event=self._stop_event, pause_event=self._pause_event,
+                            on_part_done=on_part_done, concurrency=concurrency, cache=cache,
+                        ))
+                    except BaseException:
+                        # não deixar MP3 incompleto na pasta de saída
+                        try:
+                            mp3_path.unlink()
+                        except Exception:
+                            pass
+                        raise
+                else:
+                    if backend == "edge" and edge_tts is None:
+                        LOG.log("warn", "edge-tts ausente. Fallback para gTTS.")
+                    tmp_root = temp_parts_dir(len(text_to_speak) * GTTS_BYTES_PER_CHAR)
+                    with tempfile.TemporaryDirectory(dir=tmp_root) as td:
+                        td_path = Path(td)
+                        parts = [td_path / f"part_{idx:04d}.mp3" for idx in range(1, len(chunks) + 1)]
+                        # locais: evita LOAD_ATTR repetido no laço
+                        stop_is_set = self._stop_event.is_set
+                        pause_wait = self._pause_event.wait
+                        post = self._post_progress
+                        cache_params = f"gtts|{tld}|{slow}"
+                        make_tts = functools.partial(gTTS, lang="pt", tld=tld, slow=slow)
+
+                        def synth_part(chunk: str, part: Path) -> None:
+                            # roda no pool: cada bloco é uma requisição HTTP independente
+                            pause_wait()
+                            if stop_is_set():
+                                raise Cancelled()
+                            key = SynthCache.key(cache_params, chunk) if cache is not None else ""
+                            if cache is None or not cache.fetch_file(key, part):
+                                make_tts(text=chunk).save(str(part))
+                                if cache is not None:
+                                    cache.store_file(key, part)
+
+                        # raw/auto: concat direto em paralelo com a síntese (auto confere o formato)
+                        writer = (
+                            OrderedMp3Writer(parts, mp3_path, check_format=(concat_mode == "auto"))
+                            if concat_mode != "ffmpeg" and len(parts) > 1 else None
+                        )
+                        with concurrent.futures.ThreadPoolExecutor(
+                            max_workers=concurrency, thread_name_prefix="gtts"
+                        ) as pool:
+                            futures = [pool.submit(synth_part, c, p) for c, p in zip(chunks, parts)]
+                            index = {fut: i for i, fut in enumerate(futures)}
+                            try:
+                                for done, fut in enumerate(concurrent.futures.as_completed(futures), start=1):
+                                    fut.result()
+                                    if writer is not None:
+                                        writer.part_done(index[fut])
+                                    post(done * 95 // total, f"Gerando... ({done}/{total})")
+                            except BaseException:
+                                for fut in futures:
+                                    fut.cancel()
+                                if writer is not None:
+                                    writer.close()
+                                    try:
+                                        mp3_path.unlink()  # não deixar MP3 incompleto
+                                    except Exception:
+                                        pass
+                                raise
+
+                        if writer is not None and writer.complete:
+                            writer.close()
+                        elif len(parts) == 1:
+                            _move_part(parts[0], mp3_path)  # bloco único: nada a concatenar
                         else:
-                            if backend == "edge" and edge_tts is None:
-                                LOG.log("warn", "edge-tts ausente. Fallback para gTTS.")
-                            gTTS(text=chunk, lang="pt", tld=tld, slow=slow).save(str(part))
-
-                        parts.append(part)
-
-                    self.after(0, lambda: (self.var_status.set("Concatenando MP3..."), self._set_progress(95)))
-                    if ok_ff:
-                        concat_mp3_ffmpeg(parts, mp3_path)
-                    else:
-                        concat_mp3_naive(parts, mp3_path)
-
-                self.after(0, lambda: self._set_progress(100))
-                self.after(0, lambda: self._set_busy(False, f"OK: {mp3_path.name}"))
+                            if writer is not None:
+                                # formatos diferentes: descarta o parcial e concatena no fim
+                                writer.close()
+                                LOG.log("info", "Partes com formatos diferentes: concat no fim.")
+                                try:
+                                    mp3_path.unlink()
+                                except OSError:
+                                    pass
+                            self._post_progress(95, "Concatenando MP3...")
+                            if concat_mode == "raw":
+                                concat_mp3_naive(parts, mp3_path)
+                            elif ok_ff:
+                                concat_mp3_ffmpeg(parts, mp3_path)
+                            else:
+                                naive_unsafe = True
+                                concat_mp3_naive(parts, mp3_path)
+
+                self._post_progress(100)
+                self.after(0, self._set_busy, False, f"OK: {mp3_path.name}")
                 LOG.log("info", f"Conversão concluída: {mp3_path}")
+                if cache is not None and cache.hits:
+                    LOG.log("info", f"Cache: {cache.hits}/{len(chunks)} blocos reaproveitados.")
 
                 extra = f"Arquivo: {mp3_path.name}"
                 if backend == "edge" and edge_tts is None:
                     extra += "\nAviso: edge-tts não instalado. Usado gTTS."
-                if not ok_ff:
+                if naive_unsafe:
                     extra += "\nAviso: FFmpeg não encontrado. Concat fallback pode falhar em alguns casos."
 
                 # ao terminar: reinicia motor
                 self.after(0, self._reinit_pyttsx3)
-                self.after(0, lambda: DoneDialog(self, self.out_dir, extra=extra))
+                self.after(0, functools.partial(DoneDialog, self, self.out_dir, extra=extra))
 
+            except Cancelled:
+                self.after(0, self._set_busy, False, "Conversão cancelada.")
+                LOG.log("warn", "Conversão MP3 cancelada.")
             except Exception as e:
-                self.after(0, lambda: self._set_busy(False, f"Falhou/cancelado: {e}"))
+                self.after(0, self._set_busy, False, f"Falhou: {e}")
                 LOG.log("error", f"Erro em conversão MP3: {e}")
-                if "cancelada" not in str(e).lower():
-                    self.after(0, lambda: messagebox.showerror("Erro ao gerar MP3", str(e)))
+                self._last_error = ("Erro ao gerar MP3", str(e))
             finally:
+                if cache is not None:
+                    cache.evict()
                 self._end_job_cleanup()
 
         threading.Thread(target=worker, daemon=True).start()
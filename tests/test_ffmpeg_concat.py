@@ -0,0 +1,108 @@
+"""
+Concat via FFmpeg (lista enviada por stdin).
+
+    python -m unittest discover -s tests
+
+O formato da lista é testado sempre; o concat de verdade só roda com um
+ffmpeg real no PATH (pulado caso contrário).
+"""
+import io
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import main  # noqa: E402
+
+
+def _make_mp3(path: Path, freq: int) -> None:
+    subprocess.run(
+        [
+            "ffmpeg", "-hide_banner", "-loglevel", "error", "-y",
+            "-f", "lavfi", "-i", f"sine=frequency={freq}:duration=0.3",
+            "-ar", "24000", "-ac", "1", "-b:a", "32k", str(path),
+        ],
+        check=True,
+    )
+
+
+def _decoded_seconds(path: Path) -> float:
+    # Decodifica para PCM (s16, mono, 24 kHz); falha se o FFmpeg reclamar do stream.
+    r = subprocess.run(
+        ["ffmpeg", "-hide_banner", "-v", "error", "-i", str(path),
+         "-f", "s16le", "-ac", "1", "-ar", "24000", "-"],
+        capture_output=True,
+    )
+    if r.returncode != 0 or r.stderr.strip():
+        raise AssertionError(r.stderr.decode("utf-8", "replace"))
+    return len(r.stdout) / (2 * 24000)
+
+
+class ConcatListingTest(unittest.TestCase):
+    def test_entries_use_file_protocol(self):
+        # Com a lista em pipe:0, caminho sem protocolo vira 'pipe:/...' no demuxer.
+        buf = io.BytesIO()
+        main._write_concat_listing(buf, [Path("/tmp/a b/p1.mp3"), Path("/tmp/it's/p2.mp3")])
+        lines = buf.getvalue().decode("utf-8").splitlines()
+        self.assertEqual(lines[0], "file 'file:/tmp/a b/p1.mp3'")
+        self.assertEqual(lines[1], "file 'file:/tmp/it'\\''s/p2.mp3'")
+
+    def test_relative_paths_become_absolute(self):
+        buf = io.BytesIO()
+        main._write_concat_listing(buf, [Path("p1.mp3")])
+        entry = buf.getvalue().decode("utf-8").strip()
+        self.assertTrue(entry.startswith("file 'file:"))
+        self.assertTrue(Path(entry[len("file 'file:"):-1]).is_absolute())
+
+
+@unittest.skipUnless(shutil.which("ffmpeg"), "ffmpeg não encontrado no PATH")
+class ConcatFfmpegTest(unittest.TestCase):
+    def setUp(self):
+        self._td = tempfile.TemporaryDirectory()
+        # aspas e espaço no caminho: exercita o escape da lista
+        self.dir = Path(self._td.name) / "it's dir"
+        self.dir.mkdir()
+        main.invalidate_ffmpeg_cache()
+        ok, info = main.ffmpeg_status()
+        if not ok:
+            self.skipTest(f"ffmpeg inutilizável: {info}")
+
+    def tearDown(self):
+        self._td.cleanup()
+
+    def _parts(self, n: int):
+        parts = []
+        for i in range(n):
+            p = self.dir / f"part_{i:04d}.mp3"
+            _make_mp3(p, 200 + 20 * i)
+            parts.append(p)
+        return parts
+
+    def _assert_all_audio(self, parts, out: Path):
+        # Cópia de stream perde o corte gapless de cada parte (atraso/padding do
+        # encoder, ~60 ms): a saída fica um pouco maior que a soma, nunca menor.
+        expected = sum(_decoded_seconds(p) for p in parts)
+        got = _decoded_seconds(out)
+        self.assertGreaterEqual(got, expected - 0.05)
+        self.assertLessEqual(got, expected + 0.1 * len(parts))
+
+    def test_concat_few_parts(self):
+        out = self.dir / "saida.mp3"
+        parts = self._parts(3)
+        main.concat_mp3_ffmpeg(parts, out)
+        self._assert_all_audio(parts, out)
+
+    def test_concat_in_groups(self):
+        # acima de FFMPEG_CONCAT_GROUP partes: concat em grupos e depois dos intermediários
+        parts = self._parts(main.FFMPEG_CONCAT_GROUP + 3)
+        out = self.dir / "saida.mp3"
+        main.concat_mp3_ffmpeg(parts, out)
+        self._assert_all_audio(parts, out)
+
+
+if __name__ == "__main__":
+    unittest.main()